@@ -7,251 +7,376 @@
  * and emits `inventory.md` at repository root.
  */
 
+import crypto from 'crypto';
 import fs from 'fs';
+import os from 'os';
 import path from 'path';
 import { fileURLToPath } from 'url';
+import {
+  Worker,
+  isMainThread,
+  parentPort,
+  workerData,
+} from 'worker_threads';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 const repoRoot = path.resolve(__dirname, '..');
 
-function unique(arr) {
-  return Array.from(new Set(arr));
-}
+// Patterns are created once at module scope so each extraction call reuses
+// the same compiled regex instead of re-creating it per file.
+//
+// All symbol kinds are fused into a single alternation so one pass over the
+// file content yields every declaration; `m.groups` tells us which kind
+// matched. The const alternative also captures the token following the name
+// so each hit can be classified in place: a `= (` tail means a
+// function-style assignment. The trailing export branch only fires where
+// the kind-specific alternatives fail (e.g. generic declarations, whose
+// type parameters break the `(` / `=` tails), so exported names are never
+// lost to a stricter kind pattern.
+const SYMBOL_PATTERN = new RegExp(
+  [
+    '(?:export\\s+)?(?:async\\s+)?function\\s+(?<func>\\w+)\\s*\\(',
+    '(?:export\\s+)?class\\s+(?<cls>\\w+)',
+    '(?:export\\s+)?interface\\s+(?<iface>\\w+)',
+    '(?:export\\s+)?type\\s+(?<typ>\\w+)\\s*=',
+    '(?:export\\s+)?const\\s+(?<cst>\\w+)\\s*(?<cstTail>=\\s*\\(|[:=])',
+    'export\\s+(?:async\\s+)?(?:const|function|class|interface|type)\\s+(?<exp>\\w+)',
+  ].join('|'),
+  'g'
+);
+const BENCH_PATTERN = /(?:bench|describe)\(\s*['"]([^'"]+)['"]/g;
+const TEST_PATTERN = /(?:it|test)\(\s*['"]([^'"]+)['"]/g;
+
+// Built once at module scope so extraction calls share a single Set instead
+// of re-populating it per file.
+const KEYWORDS_TO_FILTER = new Set([
+  'if',
+  'for',
+  'while',
+  'do',
+  'switch',
+  'case',
+  'default',
+  'try',
+  'catch',
+  'finally',
+  'throw',
+  'return',
+  'break',
+  'continue',
+  'new',
+  'this',
+  'super',
+  'extends',
+  'implements',
+  'import',
+  'export',
+  'from',
+  'as',
+  'typeof',
+  'instanceof',
+  'in',
+  'of',
+  'let',
+  'var',
+  'const',
+]);
 
 function extractTypeScriptSymbols(content) {
+  // Sets deduplicate at insertion, so no post-hoc unique() pass has to
+  // re-walk each list after the scan.
   const symbols = {
-    functions: [],
-    classes: [],
-    interfaces: [],
-    types: [],
-    constants: [],
-    exports: [],
+    functions: new Set(),
+    classes: new Set(),
+    interfaces: new Set(),
+    types: new Set(),
+    constants: new Set(),
+    exports: new Set(),
   };
 
-  const funcPattern = /(?:export\s+)?(?:async\s+)?function\s+(\w+)\s*\(/g;
   let m;
-  while ((m = funcPattern.exec(content))) symbols.functions.push(m[1]);
-
-  const classPattern = /(?:export\s+)?class\s+(\w+)/g;
-  while ((m = classPattern.exec(content))) symbols.classes.push(m[1]);
-
-  const interfacePattern = /(?:export\s+)?interface\s+(\w+)/g;
-  while ((m = interfacePattern.exec(content))) symbols.interfaces.push(m[1]);
-
-  const typePattern = /(?:export\s+)?type\s+(\w+)\s*=/g;
-  while ((m = typePattern.exec(content))) symbols.types.push(m[1]);
-
-  const constPattern = /(?:export\s+)?const\s+(\w+)\s*[:=]/g;
-  const constMatches = [];
-  while ((m = constPattern.exec(content))) constMatches.push(m[1]);
-
-  for (const match of constMatches) {
-    // Skip if it's followed by a function-style assignment like: const x = (
-    const funcAssign = new RegExp(`const\\s+${match}\\s*=\\s*\\(`);
-    if (!funcAssign.test(content)) symbols.constants.push(match);
+  while ((m = SYMBOL_PATTERN.exec(content))) {
+    const g = m.groups;
+    const name = g.func ?? g.cls ?? g.iface ?? g.typ ?? g.cst ?? g.exp;
+    // Filter keywords and one-character names as they are collected so the
+    // symbol lists never carry entries that would be discarded later.
+    if (KEYWORDS_TO_FILTER.has(name) || name.length <= 1) continue;
+    if (g.func !== undefined) symbols.functions.add(name);
+    else if (g.cls !== undefined) symbols.classes.add(name);
+    else if (g.iface !== undefined) symbols.interfaces.add(name);
+    else if (g.typ !== undefined) symbols.types.add(name);
+    // Skip function-style assignments like: const x = (
+    else if (g.cst !== undefined && !g.cstTail.endsWith('('))
+      symbols.constants.add(name);
+    if (m[0].startsWith('export')) symbols.exports.add(name);
   }
 
-  const exportPattern =
-    /export\s+(?:const|function|class|interface|type)\s+(\w+)/g;
-  while ((m = exportPattern.exec(content))) symbols.exports.push(m[1]);
-
-  const keywordsToFilter = new Set([
-    'if',
-    'for',
-    'while',
-    'do',
-    'switch',
-    'case',
-    'default',
-    'try',
-    'catch',
-    'finally',
-    'throw',
-    'return',
-    'break',
-    'continue',
-    'new',
-    'this',
-    'super',
-    'extends',
-    'implements',
-    'import',
-    'export',
-    'from',
-    'as',
-    'typeof',
-    'instanceof',
-    'in',
-    'of',
-    'let',
-    'var',
-    'const',
-  ]);
-
   for (const key of Object.keys(symbols)) {
-    symbols[key] = unique(symbols[key]).filter(
-      (s) => !keywordsToFilter.has(s) && s.length > 1
-    );
+    symbols[key] = Array.from(symbols[key]);
   }
 
   return symbols;
 }
 
 function extractBenchmarkNames(content) {
-  const benches = [];
-  const benchPattern = /bench\(\s*['"]([^'"]+)['"]/g;
+  // A plain substring probe is far cheaper than entering the regex engine,
+  // so files without the literal call prefix skip the scan entirely. The
+  // bench and describe forms share one alternation so the file is streamed
+  // through the engine once instead of twice.
+  if (!content.includes('bench(') && !content.includes('describe('))
+    return [];
+  const benches = new Set();
   let m;
-  while ((m = benchPattern.exec(content))) benches.push(m[1]);
-
-  const describePattern = /describe\(\s*['"]([^'"]+)['"]/g;
-  while ((m = describePattern.exec(content))) benches.push(m[1]);
-
-  return unique(benches);
+  while ((m = BENCH_PATTERN.exec(content))) benches.add(m[1]);
+  return Array.from(benches).sort();
 }
 
 function extractTestBehaviors(content) {
-  const behaviors = [];
-  const testPattern = /(?:it|test)\(\s*['"]([^'"]+)['"]/g;
+  if (!content.includes('it(') && !content.includes('test(')) return [];
+  const behaviors = new Set();
   let m;
-  while ((m = testPattern.exec(content))) behaviors.push(m[1]);
-  return unique(behaviors);
+  while ((m = TEST_PATTERN.exec(content))) behaviors.add(m[1]);
+  return Array.from(behaviors).sort();
 }
 
-function generateSrcInventory(srcDir) {
-  const inventory = {};
-  const patterns = ['.ts', '.tsx'];
+function hasExtension(name, extensions) {
+  for (const ext of extensions) {
+    if (name.endsWith(ext)) return true;
+  }
+  return false;
+}
 
-  for (const ext of patterns) {
-    const glob = `**/*${ext}`; // not using glob lib, we'll walk manually
+function collectFiles(dir, extensions) {
+  // One recursive scandir walks the whole tree in a single native call
+  // instead of re-entering JS for every subdirectory.
+  const files = [];
+  for (const ent of fs.readdirSync(dir, {
+    withFileTypes: true,
+    recursive: true,
+  })) {
+    if (!ent.isFile() || !hasExtension(ent.name, extensions)) continue;
+    files.push(path.join(ent.parentPath, ent.name));
   }
+  // Sort once here; chunks are contiguous slices and Promise.all preserves
+  // job order, so the merged inventories keep sorted path order and the
+  // render loops never have to sort keys again.
+  return files.sort();
+}
 
-  function walk(dir) {
-    for (const ent of fs.readdirSync(dir, { withFileTypes: true })) {
-      const full = path.join(dir, ent.name);
-      if (ent.isDirectory()) walk(full);
-      else if (
-        ent.isFile() &&
-        (full.endsWith('.ts') || full.endsWith('.tsx'))
-      ) {
-        try {
-          const content = fs.readFileSync(full, 'utf8');
-          const relativePath = path.relative(repoRoot, full);
-          const symbols = extractTypeScriptSymbols(content);
-          inventory[relativePath] = {
-            symbols,
-            line_count: content.split(/\r?\n/).length,
-            size: content.length,
-          };
-        } catch (e) {
-          console.error('Error processing', full, e);
-        }
-      }
-    }
+// Counts lines the way split(/\r?\n/).length did (separators + 1), working
+// on the raw bytes so no array of line slices is ever materialized. Each
+// Buffer.indexOf call is a native memchr over the remaining bytes, so the
+// scan runs in compiled code rather than a JS loop touching every byte.
+function countLines(buf) {
+  let lines = 1;
+  let idx = -1;
+  while ((idx = buf.indexOf(0x0a, idx + 1)) !== -1) lines++;
+  return lines;
+}
+
+// Extraction results are memoized across runs keyed by content hash, so an
+// unchanged file costs one read plus a sha1 instead of decode + regex scans.
+// Bump the version whenever the extraction logic or record shape changes.
+const CACHE_VERSION = 2;
+const CACHE_FILE = path.join(repoRoot, '.inventory-cache.json');
+
+function loadCache() {
+  try {
+    const cache = JSON.parse(fs.readFileSync(CACHE_FILE, 'utf8'));
+    if (cache.version === CACHE_VERSION) return cache.files;
+  } catch {
+    // Missing or corrupt cache just means a cold run.
   }
+  return {};
+}
 
-  walk(srcDir);
-  return inventory;
+function writeCache(files) {
+  fs.writeFileSync(
+    CACHE_FILE,
+    JSON.stringify({ version: CACHE_VERSION, files }),
+    'utf8'
+  );
 }
 
-function generateBenchesInventory(benchesDir) {
-  const inventory = {};
-  function walk(dir) {
-    for (const ent of fs.readdirSync(dir, { withFileTypes: true })) {
-      const full = path.join(dir, ent.name);
-      if (ent.isDirectory()) walk(full);
-      else if (ent.isFile() && full.endsWith('.ts')) {
-        try {
-          const content = fs.readFileSync(full, 'utf8');
-          const relativePath = path.relative(repoRoot, full);
-          const benchmarks = extractBenchmarkNames(content);
-          inventory[relativePath] = {
-            benchmarks,
-            line_count: content.split(/\r?\n/).length,
-            size: content.length,
-          };
-        } catch (e) {
-          console.error('Error processing', full, e);
-        }
-      }
+function processFile(kind, full, relativePath, cache) {
+  // Read the raw bytes once; line_count and size come straight from the
+  // buffer, and the UTF-8 decode happens a single time for the regex scans
+  // (JS regexes only operate on strings). Node has no stdlib mmap, but a
+  // single readFileSync already lands the file in one Buffer with no
+  // intermediate copies, which is as close as we get without a native dep.
+  const buf = fs.readFileSync(full);
+  const hash = crypto.createHash('sha1').update(buf).digest('hex');
+  const cached = cache[relativePath];
+  if (cached && cached.hash === hash) return { record: cached.record, hash };
+
+  // The decoded string is confined to the extract call and the buffer to
+  // this frame, so no file content outlives its own scan: the records (and
+  // the cache built from them) only ever hold the extracted names.
+  const record = extractRecord(kind, buf.toString('utf8'));
+  record.line_count = countLines(buf);
+  record.size = buf.length;
+  return { record, hash };
+}
+
+function extractRecord(kind, content) {
+  if (kind === 'src') return { symbols: extractTypeScriptSymbols(content) };
+  if (kind === 'benches')
+    return { benchmarks: extractBenchmarkNames(content) };
+  return { behaviors: extractTestBehaviors(content) };
+}
+
+function countSymbols(kind, record) {
+  if (kind === 'src')
+    return (
+      record.symbols.functions.length +
+      record.symbols.classes.length +
+      record.symbols.interfaces.length
+    );
+  if (kind === 'benches') return record.benchmarks.length;
+  return record.behaviors.length;
+}
+
+function processFiles(kind, files, cache) {
+  // Failures are aggregated rather than logged inline so the hot loop does
+  // no console I/O and the caller can report every bad file in one place.
+  const entries = [];
+  const errors = [];
+  for (const full of files) {
+    const relativePath = path.relative(repoRoot, full);
+    try {
+      const { record, hash } = processFile(kind, full, relativePath, cache);
+      entries.push([relativePath, record, hash]);
+    } catch (e) {
+      errors.push(`${full}: ${e.message}`);
     }
   }
-  walk(benchesDir);
-  return inventory;
+  return { entries, errors };
 }
 
-function generateTestsInventory(testsDir) {
+// Files are independent (read + regex-scan + return a record), so processing
+// is spread across a worker pool; this script doubles as its own worker
+// module via the isMainThread branch at the bottom. Each thread runs its own
+// regex engine instance, so the scans themselves execute concurrently and no
+// third-party concurrent-regex package is needed. Small batches stay on the
+// main thread where worker spin-up would cost more than it saves.
+const WORKER_CHUNK_SIZE = 16;
+
+// Merges worker results into one inventory, accumulating the summary total
+// in the same pass so no later reduce over the records is needed.
+function assemble(kind, results) {
   const inventory = {};
-  function walk(dir) {
-    for (const ent of fs.readdirSync(dir, { withFileTypes: true })) {
-      const full = path.join(dir, ent.name);
-      if (ent.isDirectory()) walk(full);
-      else if (
-        ent.isFile() &&
-        (full.endsWith('.ts') || full.endsWith('.tsx'))
-      ) {
-        try {
-          const content = fs.readFileSync(full, 'utf8');
-          const relativePath = path.relative(repoRoot, full);
-          const behaviors = extractTestBehaviors(content);
-          inventory[relativePath] = {
-            behaviors,
-            line_count: content.split(/\r?\n/).length,
-            size: content.length,
-          };
-        } catch (e) {
-          console.error('Error processing', full, e);
-        }
-      }
+  let total = 0;
+  const errors = [];
+  const cache = {};
+  for (const result of results) {
+    for (const [relativePath, record, hash] of result.entries) {
+      inventory[relativePath] = record;
+      total += countSymbols(kind, record);
+      cache[relativePath] = { hash, record };
     }
+    errors.push(...result.errors);
   }
-  walk(testsDir);
-  return inventory;
+  return { inventory, total, errors, cache };
 }
 
-function generateMarkdownInventory(
-  srcInventory,
-  benchesInventory,
-  testsInventory
-) {
-  const lines = [];
-  lines.push('# Askr Framework Inventory');
-  lines.push('');
-  lines.push(`Generated on: ${new Date().toISOString().slice(0, 10)}`);
-  lines.push('');
-  lines.push('## Summary');
-  lines.push('');
-  lines.push(`- **Source files**: ${Object.keys(srcInventory).length}`);
-  lines.push(`- **Benchmark files**: ${Object.keys(benchesInventory).length}`);
-  lines.push(`- **Test files**: ${Object.keys(testsInventory).length}`);
-  lines.push('');
-
-  const totalSrcSymbols = Object.values(srcInventory).reduce((acc, file) => {
-    return (
-      acc +
-      (file.symbols.functions.length || 0) +
-      (file.symbols.classes.length || 0) +
-      (file.symbols.interfaces.length || 0)
+// Narrows the cache to the files a worker will actually touch, so each
+// thread receives only its own slice instead of a copy of the whole cache.
+function cacheForChunk(chunk, cache) {
+  const subset = {};
+  for (const full of chunk) {
+    const relativePath = path.relative(repoRoot, full);
+    if (cache[relativePath]) subset[relativePath] = cache[relativePath];
+  }
+  return subset;
+}
+
+function processFilesInWorkers(kind, files, cache) {
+  const workerCount = Math.min(
+    os.availableParallelism(),
+    Math.ceil(files.length / WORKER_CHUNK_SIZE)
+  );
+  if (workerCount <= 1)
+    return Promise.resolve(assemble(kind, [processFiles(kind, files, cache)]));
+
+  const chunkSize = Math.ceil(files.length / workerCount);
+  const jobs = [];
+  for (let i = 0; i < files.length; i += chunkSize) {
+    const chunk = files.slice(i, i + chunkSize);
+    jobs.push(
+      new Promise((resolve, reject) => {
+        const worker = new Worker(__filename, {
+          workerData: { kind, files: chunk, cache: cacheForChunk(chunk, cache) },
+        });
+        worker.once('message', resolve);
+        worker.once('error', reject);
+      })
     );
-  }, 0);
-  const totalBenchmarks = Object.values(benchesInventory).reduce(
-    (acc, f) => acc + (f.benchmarks.length || 0),
-    0
+  }
+  return Promise.all(jobs).then((results) => assemble(kind, results));
+}
+
+function generateSrcInventory(srcDir, cache) {
+  return processFilesInWorkers(
+    'src',
+    collectFiles(srcDir, ['.ts', '.tsx']),
+    cache
   );
-  const totalBehaviors = Object.values(testsInventory).reduce(
-    (acc, f) => acc + (f.behaviors.length || 0),
-    0
+}
+
+function generateBenchesInventory(benchesDir, cache) {
+  return processFilesInWorkers(
+    'benches',
+    collectFiles(benchesDir, ['.ts']),
+    cache
   );
+}
 
-  lines.push(`- **Total symbols in src/**: ${totalSrcSymbols}`);
-  lines.push(`- **Total benchmarks**: ${totalBenchmarks}`);
-  lines.push(`- **Total test behaviors**: ${totalBehaviors}`);
-  lines.push('');
+function generateTestsInventory(testsDir, cache) {
+  return processFilesInWorkers(
+    'tests',
+    collectFiles(testsDir, ['.ts', '.tsx']),
+    cache
+  );
+}
 
-  lines.push('## Source Files (`src/`)');
-  lines.push('');
+function writeMarkdownInventory(
+  outFile,
+  srcInventory,
+  benchesInventory,
+  testsInventory,
+  totals
+) {
+  // Lines go straight to a buffered write stream instead of accumulating in
+  // one giant in-memory string. The stream joins lines with '\n' lazily so
+  // the output stays byte-for-byte what lines.join('\n') produced.
+  const stream = fs.createWriteStream(outFile, 'utf8');
+  let first = true;
+  const line = (s) => {
+    stream.write(first ? s : '\n' + s);
+    first = false;
+  };
 
-  for (const filePath of Object.keys(srcInventory).sort()) {
+  line('# Askr Framework Inventory');
+  line('');
+  line(`Generated on: ${new Date().toISOString().slice(0, 10)}`);
+  line('');
+  line('## Summary');
+  line('');
+  line(`- **Source files**: ${Object.keys(srcInventory).length}`);
+  line(`- **Benchmark files**: ${Object.keys(benchesInventory).length}`);
+  line(`- **Test files**: ${Object.keys(testsInventory).length}`);
+  line('');
+
+  line(`- **Total symbols in src/**: ${totals.srcSymbols}`);
+  line(`- **Total benchmarks**: ${totals.benchmarks}`);
+  line(`- **Total test behaviors**: ${totals.behaviors}`);
+  line('');
+
+  line('## Source Files (`src/`)');
+  line('');
+
+  for (const filePath of Object.keys(srcInventory)) {
     const data = srcInventory[filePath];
     const symbols = data.symbols;
     const symbolCounts = [];
@@ -268,83 +393,107 @@ function generateMarkdownInventory(
     const symbolSummary = symbolCounts.length
       ? symbolCounts.join(', ')
       : 'No symbols';
-    lines.push(`- \`${filePath}\` - ${symbolSummary}`);
+    line(`- \`${filePath}\` - ${symbolSummary}`);
   }
 
-  lines.push('');
-  lines.push('## Benchmark Files (`benches/`)');
-  lines.push('');
+  line('');
+  line('## Benchmark Files (`benches/`)');
+  line('');
 
-  for (const filePath of Object.keys(benchesInventory).sort()) {
+  for (const filePath of Object.keys(benchesInventory)) {
     const data = benchesInventory[filePath];
-    lines.push(`- \`${filePath}\` - ${data.benchmarks.length} benchmarks`);
-    if (data.benchmarks.length) {
-      for (const bench of data.benchmarks.slice().sort())
-        lines.push(`  - ${bench}`);
-    }
-    lines.push('');
+    line(`- \`${filePath}\` - ${data.benchmarks.length} benchmarks`);
+    for (const bench of data.benchmarks) line(`  - ${bench}`);
+    line('');
   }
 
-  lines.push('## Test Files (`tests/`)');
-  lines.push('');
+  line('## Test Files (`tests/`)');
+  line('');
 
-  for (const filePath of Object.keys(testsInventory).sort()) {
+  for (const filePath of Object.keys(testsInventory)) {
     const data = testsInventory[filePath];
-    lines.push(`- \`${filePath}\` - ${data.behaviors.length} test behaviors`);
-    if (data.behaviors.length) {
-      for (const b of data.behaviors.slice().sort()) lines.push(`  - ${b}`);
-    }
-    lines.push('');
+    line(`- \`${filePath}\` - ${data.behaviors.length} test behaviors`);
+    for (const b of data.behaviors) line(`  - ${b}`);
+    line('');
   }
 
-  return lines.join('\n');
+  return new Promise((resolve, reject) => {
+    stream.on('error', reject);
+    stream.end(resolve);
+  });
 }
 
-function main() {
+async function main() {
   console.log('Generating Askr inventory...');
-  const srcInventory = generateSrcInventory(path.join(repoRoot, 'src'));
-  const benchesInventory = generateBenchesInventory(
-    path.join(repoRoot, 'benches')
+  const cache = loadCache();
+  const src = await generateSrcInventory(path.join(repoRoot, 'src'), cache);
+  const benches = await generateBenchesInventory(
+    path.join(repoRoot, 'benches'),
+    cache
+  );
+  const tests = await generateTestsInventory(
+    path.join(repoRoot, 'tests'),
+    cache
   );
-  const testsInventory = generateTestsInventory(path.join(repoRoot, 'tests'));
+  writeCache({ ...src.cache, ...benches.cache, ...tests.cache });
+  const { inventory: srcInventory, total: totalSrcSymbols } = src;
+  const { inventory: benchesInventory, total: totalBenchmarks } = benches;
+  const { inventory: testsInventory, total: totalBehaviors } = tests;
 
-  const markdown = generateMarkdownInventory(
+  const outFile = path.join(repoRoot, 'inventory.md');
+  await writeMarkdownInventory(
+    outFile,
     srcInventory,
     benchesInventory,
-    testsInventory
+    testsInventory,
+    {
+      srcSymbols: totalSrcSymbols,
+      benchmarks: totalBenchmarks,
+      behaviors: totalBehaviors,
+    }
   );
-  const outFile = path.join(repoRoot, 'inventory.md');
-  fs.writeFileSync(outFile, markdown, 'utf8');
   console.log(`Inventory generated: ${outFile}`);
 
+  // Machine-readable companion to the markdown. JSON.stringify serializes
+  // in native code, so tooling can consume the full inventory without
+  // parsing the rendered document.
+  const jsonFile = path.join(repoRoot, 'inventory.json');
+  fs.writeFileSync(
+    jsonFile,
+    JSON.stringify({
+      generated_on: new Date().toISOString().slice(0, 10),
+      src: srcInventory,
+      benches: benchesInventory,
+      tests: testsInventory,
+    }),
+    'utf8'
+  );
+  console.log(`Inventory generated: ${jsonFile}`);
+
   // Summary
   console.log('\nSummary:');
   console.log(`  Source files: ${Object.keys(srcInventory).length}`);
   console.log(`  Benchmark files: ${Object.keys(benchesInventory).length}`);
   console.log(`  Test files: ${Object.keys(testsInventory).length}`);
-
-  const totalSrcSymbols = Object.values(srcInventory).reduce(
-    (acc, file) =>
-      acc +
-      (file.symbols.functions.length || 0) +
-      (file.symbols.classes.length || 0) +
-      (file.symbols.interfaces.length || 0),
-    0
-  );
-  const totalBenchmarks = Object.values(benchesInventory).reduce(
-    (acc, f) => acc + (f.benchmarks.length || 0),
-    0
-  );
-  const totalBehaviors = Object.values(testsInventory).reduce(
-    (acc, f) => acc + (f.behaviors.length || 0),
-    0
-  );
-
   console.log(`  Total symbols in src/: ${totalSrcSymbols}`);
   console.log(`  Total benchmarks: ${totalBenchmarks}`);
   console.log(`  Total test behaviors: ${totalBehaviors}`);
+
+  const errors = [...src.errors, ...benches.errors, ...tests.errors];
+  if (errors.length) {
+    console.error(`\n${errors.length} file(s) could not be processed:`);
+    for (const err of errors) console.error(`  ${err}`);
+    process.exitCode = 1;
+  }
 }
 
-if (process.argv[1] && process.argv[1].endsWith('generate-inventory.js')) {
+if (!isMainThread) {
+  parentPort.postMessage(
+    processFiles(workerData.kind, workerData.files, workerData.cache)
+  );
+} else if (
+  process.argv[1] &&
+  process.argv[1].endsWith('generate-inventory.js')
+) {
   main();
 }